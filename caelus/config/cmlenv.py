@@ -16,16 +16,56 @@ non-standard locations by customizing their Caelus Python configuration file.
 """
 
 import os
+import re
 import glob
 import itertools
 import logging
 import json
-from distutils.version import LooseVersion
 from . import config
 from ..utils import osutils
 
 _lgr = logging.getLogger(__name__)
 
+_version_component_re = re.compile(r"\d+|[a-zA-Z]+")
+
+# os.scandir is not available on Python 2.7
+_scandir = getattr(os, "scandir", None)
+
+def _list_subdirs(dirname):
+    """Return name and path of the sub-directories within a directory
+
+    Uses a single :func:`os.scandir` pass where available, and falls back to
+    :func:`os.listdir` on older Python versions.
+
+    Args:
+        dirname (path): Directory to be searched
+
+    Returns:
+        list: List of ``(name, path)`` tuples
+    """
+    if _scandir is None:
+        subdirs = []
+        for name in os.listdir(dirname):
+            dpath = os.path.join(dirname, name)
+            if os.path.isdir(dpath):
+                subdirs.append((name, dpath))
+        return subdirs
+    with _scandir(dirname) as entries:
+        return [(ent.name, ent.path) for ent in entries if ent.is_dir()]
+
+def _version_key(vstring):
+    """Return a sort key for a version string
+
+    Numeric components are compared as integers, and alphabetic components
+    sort before numeric ones, so that keys for arbitrary strings are always
+    comparable.
+
+    Args:
+        vstring (str): Version string, e.g., "10.11"
+    """
+    return tuple((1, int(comp), "") if comp.isdigit() else (0, 0, comp)
+                 for comp in _version_component_re.findall(vstring))
+
 def discover_versions(root=None):
     """Discover Caelus versions if no configuration is provided.
 
@@ -36,27 +76,21 @@ def discover_versions(root=None):
         root (path): Absolute path to root directory to be searched
 
     """
-    def path_to_cfg(caelus_dirs):
-        """Convert Caelus directories to configuration objects"""
-        for cpath in caelus_dirs:
-            bname = os.path.basename(cpath)
-            tmp = bname.split("-")
-            if tmp:
-                version = tmp[-1]
-                yield config.CaelusCfg(version=version,
-                                       path=cpath)
-
     rpath = root or config.get_caelus_root()
-    cdirs = glob.glob(os.path.join(rpath, "[Cc]aelus-*"))
-    return list(path_to_cfg(cdirs))
+    if not os.path.isdir(rpath):
+        return []
+    return [config.CaelusCfg(version=name.split("-")[-1], path=cpath)
+            for name, cpath in _list_subdirs(rpath)
+            if name[:7] in ("caelus-", "Caelus-")]
 
-def _filter_invalid_versions(cml_cfg):
+def _filter_invalid_versions(cml_cfg, root=None):
     """Process user configuration and filter invalid versions
 
     Args:
         cml_cfg (list): List of CML configuration entries
+        root (path): Default Caelus root directory
     """
-    root_default = config.get_caelus_root()
+    root_default = root or config.get_caelus_root()
     for ver in cml_cfg:
         vid = ver.get("version", None)
         if vid is None:
@@ -68,11 +102,29 @@ def _filter_invalid_versions(cml_cfg):
         if osutils.path_exists(pdir):
             yield ver
 
+#: Platform directories determined so far, keyed by project directory
+_platform_dir_cache = {}
 
 def _determine_platform_dir(root_path):
-    """Determine the build type platform option"""
+    """Determine the build type platform option
+
+    Successful lookups are cached per project directory until the CML
+    versions are reset. Misses are not cached, so a platform directory
+    created later (e.g., after building CML) is picked up.
+    """
+    bdir_path = _platform_dir_cache.get(root_path)
+    if bdir_path is None:
+        bdir_path = _find_platform_dir(root_path)
+        if bdir_path is not None:
+            _platform_dir_cache[root_path] = bdir_path
+    return bdir_path
+
+def _find_platform_dir(root_path):
+    """Search the platforms directory for a known build option"""
     basepath = os.path.join(root_path, "platforms")
-    if not osutils.path_exists(basepath):
+    try:
+        bdir_names = set(name for name, _ in _list_subdirs(basepath))
+    except OSError:
         return None
 
     ostype = osutils.ostype()
@@ -84,9 +136,8 @@ def _determine_platform_dir(root_path):
     for at, pt, ot, ct in itertools.product(
             arch_types, prec_types, opt_types, compilers):
         bdir_name = "%s%s%s%s%s"%(ostype, at, ct, pt, ot)
-        bdir_path = os.path.join(basepath, bdir_name)
-        if osutils.path_exists(bdir_path):
-            return bdir_path
+        if bdir_name in bdir_names:
+            return os.path.join(basepath, bdir_name)
 
 def _determine_mpi_dir(root_path, mpi_type="openmpi"):
     """Determine the installed MPI path"""
@@ -108,17 +159,19 @@ class CMLEnv(object):
     _project_dir = ""  # Project directory
     _version = ""      # Version
 
-    def __init__(self, cfg):
+    def __init__(self, cfg, root=None):
         """
         Args:
             cfg (CaelusCfg): The CML configuration object
+            root (path): Default Caelus root directory if no path is provided
         """
         self._cfg = cfg
         self._version = cfg.version
-        self._project_dir = cfg.get(
-            "path",
-            os.path.join(config.get_caelus_root(), "caelus-%s"%self.version))
-        self._project_dir = osutils.abspath(self._project_dir)
+        project_dir = cfg.get("path", None)
+        if project_dir is None:
+            project_dir = os.path.join(
+                root or config.get_caelus_root(), "caelus-%s"%self.version)
+        self._project_dir = osutils.abspath(project_dir)
         self._root_dir = os.path.dirname(self._project_dir)
 
         # Determine build dir
@@ -137,6 +190,8 @@ class CMLEnv(object):
         else:
             self._build_dir = build_dir
             self._build_option = os.path.basename(build_dir)
+        self._build_dir_ok = (
+            bool(build_dir) and osutils.path_exists(build_dir))
 
         self._process_scons_env_file()
 
@@ -167,7 +222,7 @@ class CMLEnv(object):
     @property
     def build_dir(self):
         """Return the build platform directory"""
-        if not self._build_dir or not osutils.path_exists(self._build_dir):
+        if not self._build_dir_ok:
             raise IOError("Cannot find Caelus platform directory: %s"%
                           self._build_dir)
         return self._build_dir
@@ -323,23 +378,24 @@ def _cml_env_mgr():
     """Caelus CML versions manager"""
     cml_versions = {}
     did_init = [False]
+    latest = [None]
 
     def _init_cml_versions():
         """Initialize versions based on user configuration"""
         cfg = config.get_config()
         cml_opts = cfg.caelus.caelus_cml.versions
+        root = config.get_caelus_root()
         if cml_opts:
-            cml_filtered = list(_filter_invalid_versions(cml_opts))
-            if cml_opts and not cml_filtered:
+            for cml in _filter_invalid_versions(cml_opts, root):
+                cenv = CMLEnv(cml, root=root)
+                cml_versions[cenv.version] = cenv
+            if not cml_versions:
                 _lgr.warning(
                     "No valid versions provided; check configuration file.")
-            for cml in cml_filtered:
-                cenv = CMLEnv(cml)
-                cml_versions[cenv.version] = cenv
         else:
-            cml_discovered = discover_versions()
+            cml_discovered = discover_versions(root)
             for cml in cml_discovered:
-                cenv = CMLEnv(cml)
+                cenv = CMLEnv(cml, root=root)
                 cml_versions[cenv.version] = cenv
         did_init[0] = True
 
@@ -349,13 +405,13 @@ def _cml_env_mgr():
         Returns:
             CMLEnv: The environment object
         """
-        if not cml_versions and did_init[0]:
-            raise RuntimeError("No valid Caelus CML versions found")
-        else:
+        if not did_init[0]:
             _init_cml_versions()
-        vkeys = [LooseVersion(x) for x in cml_versions]
-        vlist = sorted(vkeys, reverse=True)
-        return cml_versions[vlist[0].vstring]
+        if not cml_versions:
+            raise RuntimeError("No valid Caelus CML versions found")
+        if latest[0] is None:
+            latest[0] = cml_versions[max(cml_versions, key=_version_key)]
+        return latest[0]
 
     def _get_version(version=None):
         """Get the CML environment for the version requested
@@ -369,10 +425,10 @@ def _cml_env_mgr():
         Returns:
             CMLEnv: The environment object
         """
-        if not cml_versions and did_init[0]:
-            raise RuntimeError("No valid Caelus CML versions found")
-        else:
+        if not did_init[0]:
             _init_cml_versions()
+        if not cml_versions:
+            raise RuntimeError("No valid Caelus CML versions found")
         cfg = config.get_config()
         vkey = version or cfg.caelus.caelus_cml.get("default",
                                                     "latest")
@@ -388,6 +444,8 @@ def _cml_env_mgr():
         for key in keys:
             cml_versions.pop(key)
         did_init[0] = False
+        latest[0] = None
+        _platform_dir_cache.clear()
 
     return _get_latest_version, _get_version, _cml_reset_versions
 
@@ -23,7 +23,7 @@ import logging
 from logging.config import dictConfig
 from ..utils.struct import Struct
 from ..utils import osutils
-from ..version import version
+from ..version import get_version
 
 _rcfile_default = "caelus.yaml"
 _rcsys_var = "CAELUSRC_SYSTEM"
@@ -87,7 +87,7 @@ class CaelusCfg(Struct): # pylint: disable=too-many-ancestors
         """
         fh.write(_config_banner%{
             'timestamp': osutils.timestamp(),
-            'version': version,
+            'version': get_version(),
         })
         self.to_yaml(fh)
         fh.write("\n\n")
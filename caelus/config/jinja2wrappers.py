@@ -8,7 +8,7 @@ import os
 from jinja2 import Environment, FileSystemLoader
 
 from . import config
-from ..version import version
+from ..version import get_version
 from ..utils import osutils
 
 def get_template_dirs():
@@ -45,7 +45,7 @@ class CaelusTemplates(object):
         self.env = Environment(loader=loader)
         gvars = self.env.globals
         gvars['caelus_timestamp'] = osutils.timestamp
-        gvars['caelus_version'] = version
+        gvars['caelus_version'] = get_version()
 
     def get_template(self, name):
         """Return the contents of a template indicated by name"""
@@ -6,6 +6,7 @@ Caelus/OpenFOAM Input File Interface
 """
 
 import os
+import errno
 import logging
 from collections import Mapping
 import six
@@ -17,6 +18,30 @@ from . import printer
 
 _lgr = logging.getLogger(__name__)
 
+_getter_template = """\
+def getter(self):
+    "Getter"
+    return self.data.get({name!r})
+"""
+
+_setter_template = """\
+def setter(self, value):
+    "Setter"
+    self.data[{name!r}] = value
+"""
+
+_validated_setter_template = """\
+def setter(self, value):
+    "Setter"
+    try:
+        is_valid = value in _valid_options
+    except TypeError:
+        is_valid = False
+    if not is_valid:
+        raise ValueError(_error_msg)
+    self.data[{name!r}] = value
+"""
+
 class DictMeta(type):
     """Create property methods and add validation for properties.
 
@@ -38,20 +63,22 @@ class DictMeta(type):
 
     def __init__(cls, name, bases, cdict):
         super(DictMeta, cls).__init__(name, bases, cdict)
+        if "_default_header" in cdict:
+            cls._header_template = caelusdict.CaelusDict(
+                cdict["_default_header"])
         if "_dict_properties" in cdict:
             cls.process_properties(cdict["_dict_properties"])
             cls.process_defaults(cdict["_dict_properties"])
 
     def process_defaults(cls, proplist):
         """Process default entries"""
+        defaults = tuple((plist[0], plist[1]) for plist in proplist
+                         if plist[1] is not None)
         def create_default_entries(self):
             """Create defaults from property list"""
             data = self.data
-            for plist in proplist:
-                name = plist[0]
-                value = plist[1]
-                if value is not None:
-                    data[name] = value
+            for name, value in defaults:
+                data[name] = value
         setattr(cls, "create_default_entries", create_default_entries)
 
     def process_properties(cls, proplist):
@@ -60,27 +87,35 @@ class DictMeta(type):
             cls.process_property(plist)
 
     def process_property(cls, plist):
-        """Process a property"""
-        name = plist[0]
+        """Process a property
+
+        The getter and setter are generated from source templates so that the
+        entry name is a constant within the compiled functions.
+        """
+        name = six.moves.intern(plist[0])
         options = plist[2] if len(plist) == 3 else None
         doc = "%s"%name
-        def getter(self):
-            """Getter"""
-            return self.data.get(name, None)
+        namespace = {}
         if options:
-            def setter(self, value):
-                """Setter"""
-                if not value in options:
-                    raise ValueError(
-                        "%s: Invalid option for '%s'. "
-                        "Valid options are:\n\t%s"%(
-                            cls.__name__, name, options))
-                self.data[name] = value
+            namespace["_valid_options"] = frozenset(options)
+            namespace["_error_msg"] = (
+                "%s: Invalid option for '%s'. "
+                "Valid options are:\n\t%s"%(cls.__name__, name, options))
+            setter_src = _validated_setter_template.format(name=name)
         else:
-            def setter(self, value):
-                "Setter"
-                self.data[name] = value
-        setattr(cls, name, property(getter, setter, doc=doc))
+            setter_src = _setter_template.format(name=name)
+        # pylint: disable=exec-used
+        exec(_getter_template.format(name=name) + setter_src, namespace)
+        setattr(cls, name, property(
+            namespace["getter"], namespace["setter"], doc=doc))
+
+class _ChunkWriter(object):
+    """Minimal file-like object that collects written strings"""
+
+    def __init__(self):
+        #: List of strings written so far
+        self.chunks = []
+        self.write = self.chunks.append
 
 @six.add_metaclass(DictMeta)
 class DictFile(object):
@@ -128,17 +163,27 @@ class DictFile(object):
         entries = caelusdict.CaelusDict()
         header = None
         need_default_header = True
-        if not os.path.exists(name):
-            raise IOError("Cannot find file: %s"%name)
-        if os.path.getsize(name) > cls._size_limit:
+        try:
+            fsize = os.stat(name).st_size
+        except OSError as exc:
+            if exc.errno != errno.ENOENT:
+                raise
+            six.raise_from(
+                IOError(errno.ENOENT, "Cannot find file", name), None)
+        if fsize > cls._size_limit:
             _lgr.warning("%s size is > 5MB, will only parse header")
         else:
             cparse = parser.CaelusParser()
-            with open(name) as fh:
+            with open(name, 'rb') as fh:
                 txt = fh.read()
-                entries = cparse.parse(txt, name, debuglevel=debug)
-                header = entries.pop("FoamFile", None)
-                need_default_header = False
+            if not six.PY2:
+                txt = txt.decode('utf-8')
+            if "\r" in txt:
+                # Match the newline translation of text-mode reads
+                txt = txt.replace("\r\n", "\n").replace("\r", "\n")
+            entries = cparse.parse(txt, name, debuglevel=debug)
+            header = entries.pop("FoamFile", None)
+            need_default_header = False
         obj = cls.__new__(cls)
         obj.filename = name
         if header:
@@ -164,8 +209,11 @@ class DictFile(object):
         cdir = osutils.abspath(casedir or os.getcwd())
         name = filename or cls._default_filename
         with osutils.set_work_dir(cdir):
-            if os.path.exists(name):
-                return cls.load(filename, debug)
+            try:
+                return cls.load(name, debug)
+            except IOError as exc:
+                if exc.errno != errno.ENOENT:
+                    raise
             obj = cls.__new__(cls)
             obj.filename = name
             obj.header = obj.create_header()
@@ -182,10 +230,7 @@ class DictFile(object):
         """Create a default header"""
         obj = os.path.basename(self.filename)
         location = os.path.dirname(self.filename)
-        default_header = caelusdict.CaelusDict([
-            ("version", "2.0"),
-            ("format", "ascii"),
-            ("class", "dictionary"),])
+        default_header = self._header_template.copy()
         if location:
             default_header.location = '"%s"'%location
         default_header['object'] = '"%s"'%obj
@@ -238,10 +283,10 @@ class DictFile(object):
             self.data[key] = value
 
     def __str__(self):
-        strbuf = six.StringIO()
+        strbuf = _ChunkWriter()
         pprint = printer.DictPrinter(strbuf)
         pprint(self.data)
-        return strbuf.getvalue()
+        return "".join(strbuf.chunks)
 
     def __repr__(self):
         return "<%s: %s>"%(self.__class__.__name__,
@@ -349,6 +394,10 @@ class TurbModelProps(DictFile):
     ]
 
     _model_name = "NONE"
+    #: Model name for which the coefficients key was last computed
+    _coeffs_model = None
+    #: Cached name of the coefficients sub-dictionary
+    _coeffs_key = None
 
     @property
     def model(self):
@@ -363,8 +412,9 @@ class TurbModelProps(DictFile):
     @model.setter
     def model(self, value):
         self.data[self._model_name] = value
-        # trigger generation of coeffs dictionary if not present
-        _ = self.coeffs
+        self._coeffs_model = value
+        self._coeffs_key = value + "Coeffs"
+        self.data.setdefault(self._coeffs_key, caelusdict.CaelusDict())
 
     @property
     def coeffs(self):
@@ -376,10 +426,13 @@ class TurbModelProps(DictFile):
         name when generating the dictionary depending on the turbulence model
         selected.
         """
-        key = self.data[self._model_name] + "Coeffs"
-        if not key in self.data:
-            self.data[key] = caelusdict.CaelusDict()
-        return self.data[key]
+        model = self.data[self._model_name]
+        if model != self._coeffs_model:
+            self._coeffs_model = model
+            self._coeffs_key = model + "Coeffs"
+        if self._coeffs_key not in self.data:
+            self.data[self._coeffs_key] = caelusdict.CaelusDict()
+        return self.data[self._coeffs_key]
 
 class RASProperties(TurbModelProps):
     """constant/RASProperties interface"""
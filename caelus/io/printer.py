@@ -11,10 +11,11 @@ from collections import Mapping
 from contextlib import contextmanager
 
 import numpy as np
+import six
 
 from . import dtypes
 from ..utils import osutils
-from ..version import version
+from ..version import get_version
 
 file_banner = r"""/*---------------------------------------------------------------------------*\
  * Caelus (http://www.caelus-cml.com)
@@ -35,10 +36,18 @@ eof_separator = """\
 // ************************************************************************* //
 """
 
+#: Buffer size used when writing Caelus input files
+_write_buffer_size = 1 << 20
+#: Files are loaded as UTF-8 on Python 3, so write them the same way
+_write_kwargs = {} if six.PY2 else dict(encoding='utf-8')
+
 @contextmanager
 def foam_writer(filename, header=None):
     """Caelus/OpenFOAM file writer
 
+    Output is streamed through a large (1 MB) file buffer so that the many
+    small writes issued by the printer are flushed in a few system calls.
+
     Args:
         header (CaelusDict): The FoamFile entries
 
@@ -47,10 +56,10 @@ def foam_writer(filename, header=None):
     """
     fh = None
     try:
-        fh = open(filename, 'w')
+        fh = open(filename, 'w', _write_buffer_size, **_write_kwargs)
         fh.write(file_banner%{
             'timestamp': osutils.timestamp(),
-            'version': version,
+            'version': get_version(),
         })
         printer = DictPrinter(buf=fh)
         if header:
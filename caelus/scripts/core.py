@@ -11,7 +11,7 @@ import logging
 import argparse
 from ..config.config import get_config, configure_logging, rcfiles_loaded
 from ..config import cmlenv
-from ..version import version
+from ..version import get_version
 
 _lgr = logging.getLogger(__name__)
 
@@ -26,7 +26,7 @@ class CaelusScriptBase(object):
     #: Description of the CLI app used in help messages
     description = "Caelus CLI Application"
     #: Epilog for help messages
-    epilog = "Caelus Python Library (CPL) %s"%version
+    epilog = "Caelus Python Library (CPL) %s"%get_version()
 
     script_levels = ["INFO", "DEBUG"]
     lib_levels = ["WARNING", "INFO", "DEBUG"]
@@ -57,7 +57,7 @@ class CaelusScriptBase(object):
         parser = self.parser
         parser.add_argument(
             '--version', action='version',
-            version="Caelus Python Library (CPL) %s"%version)
+            version="Caelus Python Library (CPL) %s"%get_version())
         parser.add_argument(
             '--cml-version', default=None,
             help="CML version used for this invocation")
@@ -81,7 +81,7 @@ class CaelusScriptBase(object):
         log_to_file = (not args.no_log)
         log_file = args.cli_logs
         self.setup_logging(log_to_file, log_file, verbosity, args.quiet)
-        _lgr.info("Caelus Python Library (CPL) %s", version)
+        _lgr.info("Caelus Python Library (CPL) %s", get_version())
 
         if args.cml_version is not None:
             try:
@@ -7,28 +7,53 @@ CPL Version
 import os
 import subprocess
 import shlex
+import six
 
 _basic_version = "v1.0.1"
+_version_cache = []
+_git_dir = os.path.join(os.path.dirname(__file__), os.pardir, ".git")
+
+# Timeouts for subprocesses are not supported on Python 2.7
+_communicate_kwargs = {} if six.PY2 else dict(timeout=2)
+_timeout_error = getattr(subprocess, "TimeoutExpired", ())
 
 def git_describe():
     """Get version from git-describe"""
     dirname = os.path.dirname(__file__)
-    cwd = os.getcwd()
     git_ver = _basic_version
+    cmdline = "git describe --tags --dirty"
+    cmd = shlex.split(cmdline)
     try:
-        os.chdir(dirname)
-        cmdline = "git describe --tags --dirty"
-        cmd = shlex.split(cmdline)
-        task = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+        task = subprocess.Popen(cmd, cwd=dirname, stdout=subprocess.PIPE,
                                 stderr=subprocess.PIPE)
-        out, _ = task.communicate()
-        if task.poll() == 0:
+    except OSError:
+        return git_ver
+    try:
+        out, _ = task.communicate(**_communicate_kwargs)
+    except _timeout_error:
+        task.kill()
+        task.communicate()
+        return git_ver
+    if task.returncode == 0:
+        try:
             git_ver = out.strip().decode('ascii')
-    except:
-        pass
-    finally:
-        os.chdir(cwd)
+        except UnicodeDecodeError:
+            pass
     return git_ver
 
+def get_version():
+    """Return the CPL version string
+
+    The result is cached, so ``git describe`` runs at most once per process
+    and only when running from a git checkout; installed copies of CPL return
+    the basic version without spawning a subprocess.
+    """
+    if not _version_cache:
+        if os.path.exists(_git_dir):
+            _version_cache.append(git_describe())
+        else:
+            _version_cache.append(_basic_version)
+    return _version_cache[0]
+
 #: Version string
-version = git_describe()
+version = get_version()
@@ -74,6 +74,13 @@ def test_get_version():
     with pytest.raises(KeyError):
         cmlenv.cml_get_version("3.84")
 
+def test_versions_initialized_once():
+    cmlenv.cml_reset_versions()
+    cver1 = cmlenv.cml_get_version("10.11")
+    cver2 = cmlenv.cml_get_version("10.11")
+    assert cver1 is cver2
+    assert cmlenv.cml_get_latest_version() is cver1
+
 def test_discover_versions(caelus_directory):
     cvers = cmlenv.discover_versions(caelus_directory)
     assert len(cvers) == 3
@@ -83,6 +90,14 @@ def test_discover_versions(caelus_directory):
         assert cobj.path == os.path.join(caelus_directory,
                                          "caelus-%s"%cobj.version)
 
+def test_discover_versions_hyphenated(tmpdir):
+    os.makedirs(os.path.join(str(tmpdir), "caelus-cml-7.04"))
+    os.makedirs(os.path.join(str(tmpdir), "Caelus-8.04"))
+    tmpdir.join("caelus-9.04.tar.gz").write("")
+    cvers = cmlenv.discover_versions(str(tmpdir))
+    versions = sorted(cobj.version for cobj in cvers)
+    assert versions == ["7.04", "8.04"]
+
 def test_determine_platform_dir(caelus_directory):
     ostype = "windows" if os.name == 'nt' else os.uname()[0].lower()
     root_path = os.path.join(caelus_directory, "caelus-10.11")
@@ -90,3 +105,34 @@ def test_determine_platform_dir(caelus_directory):
     bpath_expected = os.path.join(
         root_path, "platforms", "%s64g++DPOpt"%ostype)
     assert bdir_path == bpath_expected
+
+def test_determine_platform_dir_miss_not_cached(tmpdir):
+    ostype = "windows" if os.name == 'nt' else os.uname()[0].lower()
+    root_path = str(tmpdir)
+    assert cmlenv._determine_platform_dir(root_path) is None
+    bpath_expected = os.path.join(
+        root_path, "platforms", "%s64g++DPOpt"%ostype)
+    os.makedirs(bpath_expected)
+    assert cmlenv._determine_platform_dir(root_path) == bpath_expected
+
+def test_build_dir(caelus_directory):
+    root_path = os.path.join(caelus_directory, "caelus-10.11")
+    cenv = cmlenv.CMLEnv(config.CaelusCfg(version="10.11", path=root_path))
+    assert cenv.build_dir == cmlenv._determine_platform_dir(root_path)
+    assert cenv.lib_dir == os.path.join(cenv.build_dir, "lib")
+
+def test_build_dir_missing(caelus_directory):
+    cfg = config.CaelusCfg(
+        version="10.11",
+        path=os.path.join(caelus_directory, "caelus-10.11"),
+        build_option="linux64clang++DPDebug")
+    cenv = cmlenv.CMLEnv(cfg)
+    with pytest.raises(IOError):
+        _ = cenv.build_dir
+    with pytest.raises(IOError):
+        _ = cenv.bin_dir
+
+def test_version_key():
+    versions = ["6.10", "10.11", "7.04", "9.0"]
+    assert max(versions, key=cmlenv._version_key) == "10.11"
+    assert cmlenv._version_key("7.04") < cmlenv._version_key("7.10")
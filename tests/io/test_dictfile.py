@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=missing-docstring,redefined-outer-name
+
+import errno
+import pytest
+from caelus.io import dictfile
+from caelus.io.caelusdict import CaelusDict
+
+def test_property_getter_setter():
+    cdict = dictfile.ControlDict()
+    assert cdict.application is None
+    cdict.application = "pisoSolver"
+    assert cdict.application == "pisoSolver"
+    assert cdict.data["application"] == "pisoSolver"
+    cdict.endTime = 100
+    assert cdict.endTime == 100
+
+def test_property_valid_option():
+    cdict = dictfile.ControlDict()
+    assert cdict.writeFormat == "ascii"
+    cdict.writeFormat = "binary"
+    assert cdict.writeFormat == "binary"
+
+def test_property_invalid_option():
+    cdict = dictfile.ControlDict()
+    with pytest.raises(ValueError) as excinfo:
+        cdict.writeFormat = "hdf5"
+    assert str(excinfo.value) == (
+        "ControlDict: Invalid option for 'writeFormat'. "
+        "Valid options are:\n\t('ascii', 'binary')")
+    assert cdict.writeFormat == "ascii"
+
+def test_property_unhashable_option():
+    cdict = dictfile.ControlDict()
+    with pytest.raises(ValueError):
+        cdict.writeFormat = [1]
+    assert cdict.writeFormat == "ascii"
+
+def test_turb_model_coeffs():
+    ras = dictfile.RASProperties()
+    ras.model = "kOmegaSST"
+    assert "kOmegaSSTCoeffs" in ras.data
+    ras.coeffs.beta1 = 0.075
+    assert ras.data.kOmegaSSTCoeffs.beta1 == 0.075
+
+    ras.data[ras._model_name] = "kEpsilon"
+    assert ras.coeffs is ras.data.kEpsilonCoeffs
+    assert "beta1" not in ras.coeffs
+
+def test_turb_model_coeffs_loaded(tmpdir):
+    fname = tmpdir.join("RASProperties")
+    fname.write("""\
+RASModel        realizableKE;
+
+turbulence      on;
+
+printCoeffs     on;
+
+realizableKECoeffs
+{
+    A0              4.0;
+}
+""")
+    ras = dictfile.RASProperties.load(str(fname))
+    assert ras.model == "realizableKE"
+    assert ras.coeffs.A0 == 4.0
+    ras.model = "kOmegaSST"
+    assert ras.coeffs is ras.data.kOmegaSSTCoeffs
+
+def test_load_crlf(tmpdir):
+    fname = tmpdir.join("controlDict")
+    text = """\
+FoamFile
+{
+    version     2.0;
+    format      ascii;
+    class       dictionary;
+    object      controlDict;
+}
+
+application     pisoSolver;
+
+startTime       0;
+"""
+    fname.write(text.replace("\n", "\r\n").encode('ascii'), mode='wb')
+    cdict = dictfile.ControlDict.load(str(fname))
+    assert cdict.header.object == "controlDict"
+    assert cdict.application == "pisoSolver"
+    assert cdict.startTime == 0
+
+def test_custom_default_header():
+    class CustomDict(dictfile.DictFile):
+        _default_filename = "constant/customDict"
+        _default_header = [
+            ("version", "2.0"),
+            ("format", "ascii"),
+            ("class", "volScalarField"),]
+
+    cdict = CustomDict()
+    assert cdict.header["class"] == "volScalarField"
+    assert cdict.header.location == '"constant"'
+    assert cdict.header.object == '"customDict"'
+    assert CustomDict._header_template["class"] == "volScalarField"
+    assert "object" not in CustomDict._header_template
+    assert dictfile.DictFile()._header_template["class"] == "dictionary"
+
+def test_load_missing_file(tmpdir):
+    fname = str(tmpdir.join("controlDict"))
+    with pytest.raises(IOError) as excinfo:
+        dictfile.ControlDict.load(fname)
+    assert excinfo.value.errno == errno.ENOENT
+    assert excinfo.value.filename == fname
+
+def test_read_if_present_defaults(tmpdir):
+    cdict = dictfile.ControlDict.read_if_present(casedir=str(tmpdir))
+    assert cdict.filename == "system/controlDict"
+    assert cdict.startFrom == "latestTime"
+    assert cdict.header.object == '"controlDict"'
+
+def test_read_if_present_other_errors(tmpdir):
+    tmpdir.mkdir("system").mkdir("controlDict")
+    with pytest.raises(IOError) as excinfo:
+        dictfile.ControlDict.read_if_present(casedir=str(tmpdir))
+    assert excinfo.value.errno != errno.ENOENT
+
+def test_load_non_ascii(tmpdir):
+    fname = tmpdir.join("controlDict")
+    text = u"""\
+application     pisoSolver;
+
+title           "café";
+"""
+    fname.write(text.encode('utf-8'), mode='wb')
+    cdict = dictfile.ControlDict.load(str(fname))
+    assert cdict.application == "pisoSolver"
+    assert isinstance(cdict.application, str)
+    assert cdict.data.title == '"café"'
+    assert '"café"' in str(cdict)
+
+    yaml_text = cdict.data.to_yaml()
+    assert "application: pisoSolver" in yaml_text
+    assert "!!python/unicode" not in yaml_text
+    assert CaelusDict.from_yaml(yaml_text).title == cdict.data.title
+
+    cdict.write(casedir=str(tmpdir), filename="controlDict.out")
+    cdict_out = dictfile.ControlDict.load(str(tmpdir.join("controlDict.out")))
+    assert cdict_out.data.title == cdict.data.title
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=missing-docstring,redefined-outer-name
+
+import subprocess
+import pytest
+import six
+
+from caelus import version
+
+class FakePopen(object):
+    """Stand-in for subprocess.Popen running git describe"""
+
+    def __init__(self, out=b"", returncode=0, timeout=False):
+        self.out = out
+        self.returncode = returncode
+        self.timeout = timeout
+        self.killed = False
+
+    def __call__(self, cmd, **kwargs):
+        assert cmd[:2] == ["git", "describe"]
+        assert kwargs["cwd"]
+        return self
+
+    def communicate(self, timeout=None):
+        if self.timeout and not self.killed:
+            raise subprocess.TimeoutExpired("git", timeout)
+        return self.out, b""
+
+    def kill(self):
+        self.killed = True
+
+@pytest.fixture
+def no_version_cache(monkeypatch):
+    monkeypatch.setattr(version, "_version_cache", [])
+
+def test_module_version():
+    assert version.version == version.get_version()
+
+def test_get_version_no_git(monkeypatch, tmpdir, no_version_cache):
+    def fail_describe():
+        raise AssertionError("git describe should not be invoked")
+    monkeypatch.setattr(version, "_git_dir", str(tmpdir.join(".git")))
+    monkeypatch.setattr(version, "git_describe", fail_describe)
+    assert version.get_version() == version._basic_version
+
+def test_get_version_cached(monkeypatch, tmpdir, no_version_cache):
+    calls = []
+    def describe():
+        calls.append(1)
+        return "v2.0.0"
+    monkeypatch.setattr(version, "_git_dir", str(tmpdir))
+    monkeypatch.setattr(version, "git_describe", describe)
+    assert version.get_version() == "v2.0.0"
+    assert version.get_version() == "v2.0.0"
+    assert len(calls) == 1
+
+def test_git_describe(monkeypatch):
+    monkeypatch.setattr(subprocess, "Popen", FakePopen(b"v2.0.0-3-gabc\n"))
+    assert version.git_describe() == "v2.0.0-3-gabc"
+
+def test_git_describe_errors(monkeypatch):
+    def no_git(*args, **kwargs):
+        raise OSError("git not found")
+    monkeypatch.setattr(subprocess, "Popen", no_git)
+    assert version.git_describe() == version._basic_version
+
+    monkeypatch.setattr(subprocess, "Popen", FakePopen(returncode=128))
+    assert version.git_describe() == version._basic_version
+
+    monkeypatch.setattr(subprocess, "Popen", FakePopen(b"v2.0\xff"))
+    assert version.git_describe() == version._basic_version
+
+@pytest.mark.skipif(six.PY2, reason="No subprocess timeouts on Python 2.7")
+def test_git_describe_timeout(monkeypatch):
+    proc = FakePopen(b"v2.0.0", timeout=True)
+    monkeypatch.setattr(subprocess, "Popen", proc)
+    assert version.git_describe() == version._basic_version
+    assert proc.killed